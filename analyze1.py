@@ -3,6 +3,8 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+import queries
+
 def connect_to_database(db_name):
     """ Connect to the SQLite database. """
     return sqlite3.connect(db_name)
@@ -135,95 +137,26 @@ def plot_playtime_vs_price(playtime_price_data):
     plt.savefig('playtime_vs_price_correlation.png', bbox_inches='tight')
     plt.show()
 
-def main():
+def main(db_name='buy_habits.db'):
     # Connect to the buying habits database
-    conn_habits = connect_to_database('buy_habits.db')
-
-    # Queries
-    genre_query = '''
-    SELECT json_each.value AS genre, COUNT(*) AS count
-    FROM buying_habits, json_each(genres)
-    GROUP BY genre
-    ORDER BY count DESC
-    '''
-
-    playtime_query = '''
-    SELECT game_name, AVG(playtime) AS average_playtime
-    FROM buying_habits
-    GROUP BY game_name
-    HAVING COUNT(DISTINCT steam_id) > 30
-    ORDER BY average_playtime DESC
-    LIMIT 30
-    '''
-
-    most_owned_query = '''
-    SELECT game_name, COUNT(*) AS owner_count
-    FROM buying_habits
-    GROUP BY game_name
-    ORDER BY owner_count DESC
-    LIMIT 10
-    '''
-
-    avg_playtime_by_genre_query = '''
-    SELECT genre.value AS genre, AVG(playtime) AS avg_playtime
-    FROM buying_habits
-    JOIN json_each(genres) AS genre ON 1=1
-    GROUP BY genre.value
-    ORDER BY avg_playtime DESC
-    '''
-
-    # Query to get average price by genre
-    avg_price_by_genre_query = '''
-    SELECT genre.value AS genre, AVG(price_usd) AS avg_price_usd
-    FROM buying_habits
-    JOIN json_each(genres) AS genre ON 1=1
-    GROUP BY genre.value
-    ORDER BY avg_price_usd ASC
-    '''
-
-    # Query to get top developers
-    top_developers_query = '''
-    SELECT developer, COUNT(*) AS game_count
-    FROM buying_habits
-    GROUP BY developer
-    ORDER BY game_count DESC
-    LIMIT 10
-    '''
-
-    # Query to get top publishers
-    top_publishers_query = '''
-    SELECT publisher, COUNT(*) AS game_count
-    FROM buying_habits
-    GROUP BY publisher
-    ORDER BY game_count DESC
-    LIMIT 10
-    '''
-
-    # Query for discount analysis
-    discount_analysis_query = '''
-    SELECT 
-        AVG(price_usd) AS avg_price_on_sale_usd,
-        AVG(price_usd * (1 - discount_percentage / 100.0)) AS avg_price_after_discount_usd
-    FROM buying_habits
-    WHERE discount_percentage > 0
-    '''
+    conn_habits = connect_to_database(db_name)
 
     # Fetch data
-    genre_distribution = fetch_data(genre_query, conn_habits)
-    average_playtime = fetch_data(playtime_query, conn_habits)
-    most_owned_games = fetch_data(most_owned_query, conn_habits)
-    avg_playtime_by_genre = fetch_data(avg_playtime_by_genre_query, conn_habits)
-    avg_price_data = fetch_data(avg_price_by_genre_query, conn_habits)
-    top_developers = fetch_data(top_developers_query, conn_habits)
-    top_publishers = fetch_data(top_publishers_query, conn_habits)
-    discount_data = fetch_data(discount_analysis_query, conn_habits)
+    genre_distribution = fetch_data(queries.GENRE_QUERY, conn_habits)
+    average_playtime = fetch_data(queries.PLAYTIME_QUERY, conn_habits)
+    most_owned_games = fetch_data(queries.MOST_OWNED_QUERY, conn_habits)
+    avg_playtime_by_genre = fetch_data(queries.AVG_PLAYTIME_BY_GENRE_QUERY, conn_habits)
+    avg_price_data = fetch_data(queries.AVG_PRICE_BY_GENRE_QUERY, conn_habits)
+    top_developers = fetch_data(queries.TOP_DEVELOPERS_QUERY, conn_habits)
+    top_publishers = fetch_data(queries.TOP_PUBLISHERS_QUERY, conn_habits)
+    discount_data = fetch_data(queries.DISCOUNT_ANALYSIS_QUERY, conn_habits)
 
     # Price Distribution Analysis
-    price_data = fetch_data("SELECT price_usd FROM buying_habits", conn_habits)
+    price_data = fetch_data(queries.PRICE_QUERY, conn_habits)
     plot_price_distribution(price_data)
 
     # Playtime vs Price Correlation
-    playtime_price_data = fetch_data("SELECT AVG(playtime) AS average_playtime, AVG(price_usd) AS price_usd FROM buying_habits GROUP BY game_name", conn_habits)
+    playtime_price_data = fetch_data(queries.PLAYTIME_PRICE_CORRELATION_QUERY, conn_habits)
     plot_playtime_vs_price(playtime_price_data)
 
     # Visualization
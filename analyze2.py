@@ -3,6 +3,8 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+import queries
+
 def connect_to_database(db_name):
     """ Connect to the SQLite database. """
     return sqlite3.connect(db_name)
@@ -63,36 +65,18 @@ def plot_average_price_by_game(average_price_data):
     plt.savefig('average_price_by_game.png', bbox_inches='tight')
     plt.show()
 
-def main():
+def main(db_name='buy_habits.db'):
     # Connect to the buying habits database
-    conn_habits = connect_to_database('buy_habits.db')
-
-    # Query to get total spending by game
-    total_spending_query = '''
-    SELECT game_name, SUM(price_usd) AS total_spending
-    FROM buying_habits
-    GROUP BY game_name
-    ORDER BY total_spending DESC
-    LIMIT 20
-    '''
+    conn_habits = connect_to_database(db_name)
 
     # Fetch total spending data
-    total_spending_data = fetch_data(total_spending_query, conn_habits)
+    total_spending_data = fetch_data(queries.TOTAL_SPENDING_QUERY, conn_habits)
 
     # Plot total spending by game
     plot_spending_by_game(total_spending_data)
 
-    # Query to get average price spent by game
-    average_price_query = '''
-    SELECT game_name, AVG(price_usd) AS average_price
-    FROM buying_habits
-    GROUP BY game_name
-    ORDER BY average_price DESC
-    LIMIT 20
-    '''
-
     # Fetch average price data
-    average_price_data = fetch_data(average_price_query, conn_habits)
+    average_price_data = fetch_data(queries.AVERAGE_PRICE_QUERY, conn_habits)
 
     # Plot average price by game
     plot_average_price_by_game(average_price_data)
@@ -2,6 +2,8 @@ import sqlite3
 import pandas as pd
 import matplotlib.pyplot as plt
 
+import queries
+
 def connect_to_database(db_name):
     """ Connect to the SQLite database. """
     return sqlite3.connect(db_name)
@@ -21,7 +23,7 @@ def plot_currency_distribution(currency_data):
     others_row = pd.DataFrame({'currency': ['Others'], 'count': [others_count]})
     
     # Filter out the 'Others' and keep the rest
-    currency_data = currency_data[currency_data['percentage'] >= 1]._append(others_row, ignore_index=True)
+    currency_data = pd.concat([currency_data[currency_data['percentage'] >= 1], others_row], ignore_index=True)
 
     # Plotting
     plt.figure(figsize=(10, 8))  # Set figure size
@@ -33,20 +35,12 @@ def plot_currency_distribution(currency_data):
     plt.savefig('currency_distribution.png', bbox_inches='tight')
     plt.show()
 
-def main():
+def main(db_name='buy_habits.db'):
     # Connect to the buying habits database
-    conn_habits = connect_to_database('buy_habits.db')
-
-    # Query to get the count of each currency in the database
-    currency_query = '''
-    SELECT currency, COUNT(*) AS count
-    FROM buying_habits
-    GROUP BY currency
-    ORDER BY count DESC
-    '''
+    conn_habits = connect_to_database(db_name)
 
     # Fetch currency data
-    currency_data = fetch_currency_data(currency_query, conn_habits)
+    currency_data = fetch_currency_data(queries.CURRENCY_QUERY, conn_habits)
 
     # Plot the currency distribution pie chart
     plot_currency_distribution(currency_data)
@@ -4,6 +4,8 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 import numpy as np
 
+import queries
+
 def connect_to_database(db_name):
     """ Connect to the SQLite database. """
     return sqlite3.connect(db_name)
@@ -63,33 +65,18 @@ def categorize_price(row):
     else:
         return 'Above $50'
 
-def main():
-    conn_habits = connect_to_database('buy_habits.db')
+def prepare_playtime_price_data(playtime_price_data):
+    """ Drop free games and add a price category column for the scatter and violin plots. """
+    playtime_price_data = playtime_price_data[playtime_price_data['price_usd'] > 0].copy()  # Exclude free games for scatter plot
+    playtime_price_data['price_category'] = playtime_price_data.apply(categorize_price, axis=1)
+    return playtime_price_data
 
-    # Query to get playtime and price for all games
-    playtime_price_query = '''
-    SELECT AVG(playtime) AS average_playtime, price_usd
-    FROM buying_habits
-    GROUP BY game_name
-    '''
-    
-    # Query to get playtime data for free games
-    free_games_query = '''
-    SELECT game_name, AVG(playtime) AS average_playtime
-    FROM buying_habits
-    WHERE price_usd = 0
-    GROUP BY game_name
-    ORDER BY average_playtime DESC
-    LIMIT 20
-    '''
+def main(db_name='buy_habits.db'):
+    conn_habits = connect_to_database(db_name)
 
     # Fetch data
-    playtime_price_data = fetch_data(playtime_price_query, conn_habits)
-    playtime_price_data = playtime_price_data[playtime_price_data['price_usd'] > 0]  # Exclude free games for scatter plot
-    playtime_free_games = fetch_data(free_games_query, conn_habits)
-    
-    # Add price categories to playtime-price data
-    playtime_price_data['price_category'] = playtime_price_data.apply(categorize_price, axis=1)
+    playtime_price_data = prepare_playtime_price_data(fetch_data(queries.PLAYTIME_PRICE_QUERY, conn_habits))
+    playtime_free_games = fetch_data(queries.FREE_GAMES_QUERY, conn_habits)
     
     # Violin plot data by price category
     playtime_price_category_data = playtime_price_data[['price_category', 'average_playtime']].copy()
@@ -0,0 +1,132 @@
+import argparse
+import csv
+import os
+import sqlite3
+import statistics
+import tempfile
+import time
+import warnings
+
+import matplotlib
+matplotlib.use('Agg')  # Render off-screen so plt.show() does not block
+import matplotlib.pyplot as plt
+
+import analyze1
+import analyze2
+import analyze3
+import analyze4
+import generate_data
+import queries
+
+# (name, query, plot function or None, how to turn the query result into the plot input)
+CASES = [
+    ('genre_distribution', queries.GENRE_QUERY, analyze1.plot_genre_distribution, None),
+    ('average_playtime', queries.PLAYTIME_QUERY, analyze1.plot_average_playtime, None),
+    ('most_owned_games', queries.MOST_OWNED_QUERY, analyze1.plot_most_owned_games, None),
+    ('avg_playtime_by_genre', queries.AVG_PLAYTIME_BY_GENRE_QUERY, None, None),
+    ('avg_price_by_genre', queries.AVG_PRICE_BY_GENRE_QUERY, analyze1.plot_average_price_by_genre, None),
+    ('top_developers', queries.TOP_DEVELOPERS_QUERY, analyze1.plot_top_developers, None),
+    ('top_publishers', queries.TOP_PUBLISHERS_QUERY, analyze1.plot_top_publishers, None),
+    ('discount_analysis', queries.DISCOUNT_ANALYSIS_QUERY, analyze1.discount_analysis, None),
+    ('price_distribution', queries.PRICE_QUERY, analyze1.plot_price_distribution, None),
+    ('playtime_vs_price', queries.PLAYTIME_PRICE_CORRELATION_QUERY, analyze1.plot_playtime_vs_price, None),
+    ('spending_by_game', queries.TOTAL_SPENDING_QUERY, analyze2.plot_spending_by_game, None),
+    ('average_price_by_game', queries.AVERAGE_PRICE_QUERY, analyze2.plot_average_price_by_game, None),
+    ('currency_distribution', queries.CURRENCY_QUERY, analyze3.plot_currency_distribution, None),
+    ('playtime_vs_price_scatter', queries.PLAYTIME_PRICE_QUERY, analyze4.plot_playtime_vs_price_scatter,
+     analyze4.prepare_playtime_price_data),
+    ('playtime_for_free_games', queries.FREE_GAMES_QUERY, analyze4.plot_playtime_for_free_games, None),
+    ('playtime_by_price_category', queries.PLAYTIME_PRICE_QUERY, analyze4.plot_playtime_by_price_category,
+     lambda data: analyze4.prepare_playtime_price_data(data)[['price_category', 'average_playtime']]),
+]
+
+def time_call(func, repeat):
+    """ Run func `repeat` times and return the timings in seconds and the last result. """
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return timings, result
+
+def benchmark_size(size, db_path, repeat):
+    """ Time every query and plot against one database and return a list of result rows. """
+    results = []
+    conn = sqlite3.connect(db_path)
+    row_count = conn.execute('SELECT COUNT(*) FROM buying_habits').fetchone()[0]
+
+    for name, query, plot, prepare in CASES:
+        timings, data = time_call(lambda: analyze1.fetch_data(query, conn), repeat)
+        results.append({'size': size, 'rows': row_count, 'name': name, 'kind': 'query', 'timings': timings})
+
+        if plot is None:
+            continue
+        if prepare is not None:
+            data = prepare(data)
+
+        def run_plot():
+            # Plot functions may modify their input, so give each run a fresh copy
+            plot(data.copy())
+            plt.close('all')
+
+        timings, _ = time_call(run_plot, repeat)
+        results.append({'size': size, 'rows': row_count, 'name': name, 'kind': 'plot', 'timings': timings})
+
+    conn.close()
+    return results
+
+def print_report(results):
+    """ Print a table of median and best timings. """
+    print(f"{'size':>6} {'rows':>10} {'kind':<6} {'name':<28} {'median (s)':>11} {'min (s)':>9}")
+    for row in results:
+        print(f"{row['size']:>6} {row['rows']:>10} {row['kind']:<6} {row['name']:<28} "
+              f"{statistics.median(row['timings']):>11.4f} {min(row['timings']):>9.4f}")
+
+def write_csv(results, path):
+    """ Write the results to a CSV file so runs can be compared later. """
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['size', 'rows', 'kind', 'name', 'median_s', 'min_s', 'max_s', 'repeat'])
+        for row in results:
+            writer.writerow([row['size'], row['rows'], row['kind'], row['name'],
+                             f"{statistics.median(row['timings']):.6f}", f"{min(row['timings']):.6f}",
+                             f"{max(row['timings']):.6f}", len(row['timings'])])
+
+def main():
+    parser = argparse.ArgumentParser(description='Time the analyze queries and plots at several data sizes.')
+    parser.add_argument('sizes', nargs='*', default=['1M', '10M', '50M'],
+                        help='sizes to benchmark, as accepted by generate_data.py (default: 1M 10M 50M)')
+    parser.add_argument('--data-dir', default='bench_data', help='directory holding the generated databases')
+    parser.add_argument('--generate', action='store_true', help='generate any missing databases first')
+    parser.add_argument('--repeat', type=int, default=3, help='number of timed runs per step')
+    parser.add_argument('--csv', help='also write the results to this CSV file')
+    args = parser.parse_args()
+
+    # The seaborn deprecation warnings from the plot functions would drown out the report
+    warnings.simplefilter('ignore', FutureWarning)
+
+    data_dir = os.path.abspath(args.data_dir)
+    results = []
+    for size in args.sizes:
+        db_path = os.path.join(data_dir, f'buy_habits_{size}.db')
+        if not os.path.exists(db_path):
+            if not args.generate:
+                parser.error(f"{db_path} not found; run generate_data.py {size} or pass --generate")
+            generate_data.generate(size, data_dir)
+
+        # The plot functions save their PNGs to the working directory, so keep them out of the repo
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmp:
+            os.chdir(tmp)
+            try:
+                results.extend(benchmark_size(size, db_path, args.repeat))
+            finally:
+                os.chdir(cwd)
+
+    print_report(results)
+    if args.csv:
+        write_csv(results, args.csv)
+
+if __name__ == "__main__":
+    main()
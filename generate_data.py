@@ -0,0 +1,231 @@
+import argparse
+import bisect
+import itertools
+import json
+import os
+import random
+import sqlite3
+import time
+
+# Row counts for the named benchmark sizes
+SIZES = {
+    '1M': 1_000_000,
+    '10M': 10_000_000,
+    '50M': 50_000_000,
+}
+
+GENRES = ['Action', 'Adventure', 'Casual', 'Indie', 'Massively Multiplayer', 'Racing', 'RPG',
+          'Simulation', 'Sports', 'Strategy', 'Free to Play', 'Early Access']
+
+PLATFORMS = ['windows', 'windows, mac', 'windows, mac, linux', 'windows, linux']
+
+# Currency code and how many units of it one USD buys, weighted by how often it appears
+CURRENCIES = [('USD', 1.0, 40), ('EUR', 0.92, 25), ('GBP', 0.79, 8), ('RUB', 92.0, 7), ('BRL', 5.0, 5),
+              ('CAD', 1.36, 4), ('PLN', 4.0, 3), ('TRY', 32.0, 3), ('AUD', 1.52, 3), ('JPY', 150.0, 2)]
+
+# Typical Steam price points in USD, weighted by how often they appear
+PRICE_POINTS = [(0.0, 20), (0.99, 4), (4.99, 10), (9.99, 14), (14.99, 10), (19.99, 12),
+                (29.99, 10), (39.99, 8), (59.99, 8), (69.99, 4)]
+
+BATCH_SIZE = 100_000
+
+def parse_size(size):
+    """ Turn a size such as '10M', '250k' or '5000' into a row count. """
+    if size in SIZES:
+        return SIZES[size]
+    suffix = size[-1].lower()
+    if suffix == 'k':
+        return int(float(size[:-1]) * 1_000)
+    if suffix == 'm':
+        return int(float(size[:-1]) * 1_000_000)
+    return int(size)
+
+def zipf_cum_weights(n, skew):
+    """ Cumulative Zipf weights for ranks 1..n, so a few items take most of the picks. """
+    return list(itertools.accumulate(1.0 / rank ** skew for rank in range(1, n + 1)))
+
+def pick(rng, cum_weights):
+    """ Pick an index according to cumulative weights. """
+    return bisect.bisect(cum_weights, rng.random() * cum_weights[-1])
+
+def make_catalog(rng, num_games):
+    """ Build a catalog of fake games, ordered from most to least popular. """
+    developers = [f'Studio {i}' for i in range(max(10, num_games // 20))]
+    publishers = [f'Publisher {i}' for i in range(max(10, num_games // 50))]
+    developer_weights = zipf_cum_weights(len(developers), 1.1)
+    publisher_weights = zipf_cum_weights(len(publishers), 1.1)
+    prices, price_weights = zip(*PRICE_POINTS)
+
+    catalog = []
+    for i in range(num_games):
+        price_usd = rng.choices(prices, weights=price_weights)[0]
+        genres = rng.sample(GENRES[:-2], rng.randint(1, 3))
+        if price_usd == 0:
+            genres.append('Free to Play')
+        if rng.random() < 0.1:
+            genres.append('Early Access')
+        catalog.append({
+            'app_id': 10 * (i + 1),
+            'game_name': f'Game {i + 1}',
+            'genres': json.dumps(genres),
+            'price_usd': price_usd,
+            'discount_percentage': rng.choice([10, 25, 33, 50, 75, 90]) if price_usd and rng.random() < 0.2 else 0,
+            'release_date': f'{rng.randint(1, 28)} {rng.choice(["Jan", "Mar", "Jun", "Sep", "Nov"])}, {rng.randint(2004, 2024)}',
+            'developer': developers[pick(rng, developer_weights)],
+            'publisher': publishers[pick(rng, publisher_weights)],
+            'metacritic_score': rng.randint(40, 97) if rng.random() < 0.3 else None,
+            'platforms': rng.choice(PLATFORMS),
+            'steam_rating': rng.randint(1, 9),
+            'number_of_reviews': int(rng.paretovariate(1.2) * 50),
+            'tags': json.dumps([{'id': 2, 'description': 'Single-player'}]),
+            # Average hours played, long-tailed so a few games soak up most of the playtime
+            'mean_playtime': rng.lognormvariate(2.0, 1.5),
+        })
+    return catalog
+
+def steam_id_for(user_index):
+    """ Steam ID of the user_index-th generated user. """
+    return str(76561197960265728 + user_index)
+
+def create_users_db(path, num_users):
+    """ Write a steam_users database with the same schema as UserGatherer.py. """
+    conn = sqlite3.connect(path)
+    conn.execute('''
+    CREATE TABLE IF NOT EXISTS steam_users (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        steam_id TEXT UNIQUE
+    , last_processed INTEGER DEFAULT 0)
+    ''')
+    conn.executemany('INSERT OR IGNORE INTO steam_users (steam_id, last_processed) VALUES (?, 1)',
+                     ((steam_id_for(i),) for i in range(num_users)))
+    conn.commit()
+    conn.close()
+
+def draw_library(rng, game_weights, library_size):
+    """ Draw library_size distinct game indices, favouring the popular games. """
+    if library_size > len(game_weights) // 2:
+        # Rejection sampling would crawl through the long tail, so take a plain sample instead
+        return rng.sample(range(len(game_weights)), library_size)
+    library = set()
+    while len(library) < library_size:
+        library.add(pick(rng, game_weights))
+    return library
+
+def create_habits_db(path, num_rows, catalog, skew, rng):
+    """ Write a buying_habits database with `num_rows` rows of skewed game ownership.
+
+    Every user gets their own Steam ID and owns each game at most once, like the rows written by
+    secure_steam_mine.py. Returns the number of users that own at least one game.
+    """
+    conn = sqlite3.connect(path)
+    conn.execute('PRAGMA journal_mode = OFF')
+    conn.execute('PRAGMA synchronous = OFF')
+    conn.execute('''
+    CREATE TABLE IF NOT EXISTS buying_habits (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        steam_id TEXT NOT NULL,
+        game_name TEXT,
+        app_id INTEGER,
+        playtime REAL,
+        genres TEXT,
+        on_sale BOOLEAN,
+        price REAL,
+        price_usd REAL,
+        discount_percentage REAL,
+        release_date TEXT,
+        developer TEXT,
+        publisher TEXT,
+        metacritic_score INTEGER,
+        platforms TEXT,
+        currency TEXT,
+        steam_rating REAL,
+        number_of_reviews INTEGER,
+        tags TEXT
+    )
+    ''')
+
+    game_weights = zipf_cum_weights(len(catalog), skew)
+    currency_weights = list(itertools.accumulate(weight for _, _, weight in CURRENCIES))
+
+    num_users = 0
+
+    def rows():
+        # Each user owns a run of games; the library size is long-tailed like real Steam accounts
+        nonlocal num_users
+        remaining = num_rows
+        while remaining > 0:
+            steam_id = steam_id_for(num_users)
+            num_users += 1
+            currency, rate, _ = CURRENCIES[pick(rng, currency_weights)]
+            library_size = min(remaining, len(catalog), int(rng.paretovariate(1.3) * 20))
+            remaining -= library_size
+            for game_index in draw_library(rng, game_weights, library_size):
+                game = catalog[game_index]
+                # Most owned games are barely played
+                playtime = 0.0 if rng.random() < 0.3 else round(rng.expovariate(1.0 / game['mean_playtime']), 2)
+                yield (steam_id, game['game_name'], game['app_id'], playtime, game['genres'],
+                       game['discount_percentage'] > 0, round(game['price_usd'] * rate, 2), game['price_usd'],
+                       game['discount_percentage'], game['release_date'], game['developer'], game['publisher'],
+                       game['metacritic_score'], game['platforms'], currency, game['steam_rating'],
+                       game['number_of_reviews'], game['tags'])
+
+    insert = '''
+    INSERT INTO buying_habits (steam_id, game_name, app_id, playtime, genres, on_sale, price, price_usd,
+                               discount_percentage, release_date, developer, publisher,
+                               metacritic_score, platforms, currency, steam_rating,
+                               number_of_reviews, tags)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+    rows_iter = rows()
+    written = 0
+    while True:
+        batch = list(itertools.islice(rows_iter, BATCH_SIZE))
+        if not batch:
+            break
+        conn.executemany(insert, batch)
+        conn.commit()
+        written += len(batch)
+        print(f"Written: {written} / {num_rows}")
+    conn.close()
+    return num_users
+
+def generate(size, out_dir='bench_data', num_users=None, num_games=None, skew=1.1, seed=0):
+    """ Generate the buying_habits and steam_users databases for one size and return their paths. """
+    num_rows = parse_size(size)
+    # Catalog grows slowly with the data
+    num_games = num_games or max(500, min(100_000, num_rows // 200))
+    rng = random.Random(seed)
+
+    os.makedirs(out_dir, exist_ok=True)
+    habits_path = os.path.join(out_dir, f'buy_habits_{size}.db')
+    users_path = os.path.join(out_dir, f'steam_users_{size}.db')
+    for path in (habits_path, users_path):
+        if os.path.exists(path):
+            os.remove(path)
+
+    start = time.perf_counter()
+    catalog = make_catalog(rng, num_games)
+    owners = create_habits_db(habits_path, num_rows, catalog, skew, rng)
+    # Extra users beyond the owners stand in for accounts with private or empty libraries
+    num_users = max(num_users or 0, owners)
+    create_users_db(users_path, num_users)
+    print(f"Generated {num_rows} rows for {num_users} users and {num_games} games "
+          f"in {time.perf_counter() - start:.1f}s: {habits_path}, {users_path}")
+    return habits_path, users_path
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate synthetic Steam databases for benchmarking.')
+    parser.add_argument('sizes', nargs='*', default=['1M'],
+                        help='row counts to generate, e.g. 1M 10M 50M or 250k (default: 1M)')
+    parser.add_argument('--out-dir', default='bench_data', help='directory to write the databases to')
+    parser.add_argument('--users', type=int, help='minimum number of Steam users (default: one per generated library)')
+    parser.add_argument('--games', type=int, help='number of games in the catalog (default: rows / 200)')
+    parser.add_argument('--skew', type=float, default=1.1, help='Zipf exponent for game popularity')
+    parser.add_argument('--seed', type=int, default=0, help='random seed')
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        generate(size, args.out_dir, args.users, args.games, args.skew, args.seed)
+
+if __name__ == "__main__":
+    main()
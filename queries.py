@@ -0,0 +1,124 @@
+""" SQL queries used by the analyze scripts, kept in one place so they can be reused and benchmarked. """
+
+# analyze1.py
+
+GENRE_QUERY = '''
+SELECT json_each.value AS genre, COUNT(*) AS count
+FROM buying_habits, json_each(genres)
+GROUP BY genre
+ORDER BY count DESC
+'''
+
+PLAYTIME_QUERY = '''
+SELECT game_name, AVG(playtime) AS average_playtime
+FROM buying_habits
+GROUP BY game_name
+HAVING COUNT(DISTINCT steam_id) > 30
+ORDER BY average_playtime DESC
+LIMIT 30
+'''
+
+MOST_OWNED_QUERY = '''
+SELECT game_name, COUNT(*) AS owner_count
+FROM buying_habits
+GROUP BY game_name
+ORDER BY owner_count DESC
+LIMIT 10
+'''
+
+AVG_PLAYTIME_BY_GENRE_QUERY = '''
+SELECT genre.value AS genre, AVG(playtime) AS avg_playtime
+FROM buying_habits
+JOIN json_each(genres) AS genre ON 1=1
+GROUP BY genre.value
+ORDER BY avg_playtime DESC
+'''
+
+# Query to get average price by genre
+AVG_PRICE_BY_GENRE_QUERY = '''
+SELECT genre.value AS genre, AVG(price_usd) AS avg_price_usd
+FROM buying_habits
+JOIN json_each(genres) AS genre ON 1=1
+GROUP BY genre.value
+ORDER BY avg_price_usd ASC
+'''
+
+# Query to get top developers
+TOP_DEVELOPERS_QUERY = '''
+SELECT developer, COUNT(*) AS game_count
+FROM buying_habits
+GROUP BY developer
+ORDER BY game_count DESC
+LIMIT 10
+'''
+
+# Query to get top publishers
+TOP_PUBLISHERS_QUERY = '''
+SELECT publisher, COUNT(*) AS game_count
+FROM buying_habits
+GROUP BY publisher
+ORDER BY game_count DESC
+LIMIT 10
+'''
+
+# Query for discount analysis
+DISCOUNT_ANALYSIS_QUERY = '''
+SELECT
+    AVG(price_usd) AS avg_price_on_sale_usd,
+    AVG(price_usd * (1 - discount_percentage / 100.0)) AS avg_price_after_discount_usd
+FROM buying_habits
+WHERE discount_percentage > 0
+'''
+
+PRICE_QUERY = "SELECT price_usd FROM buying_habits"
+
+PLAYTIME_PRICE_CORRELATION_QUERY = "SELECT AVG(playtime) AS average_playtime, AVG(price_usd) AS price_usd FROM buying_habits GROUP BY game_name"
+
+# analyze2.py
+
+# Query to get total spending by game
+TOTAL_SPENDING_QUERY = '''
+SELECT game_name, SUM(price_usd) AS total_spending
+FROM buying_habits
+GROUP BY game_name
+ORDER BY total_spending DESC
+LIMIT 20
+'''
+
+# Query to get average price spent by game
+AVERAGE_PRICE_QUERY = '''
+SELECT game_name, AVG(price_usd) AS average_price
+FROM buying_habits
+GROUP BY game_name
+ORDER BY average_price DESC
+LIMIT 20
+'''
+
+# analyze3.py
+
+# Query to get the count of each currency in the database
+CURRENCY_QUERY = '''
+SELECT currency, COUNT(*) AS count
+FROM buying_habits
+GROUP BY currency
+ORDER BY count DESC
+'''
+
+# analyze4.py
+
+# Query to get playtime and price for all games
+PLAYTIME_PRICE_QUERY = '''
+SELECT AVG(playtime) AS average_playtime, price_usd
+FROM buying_habits
+GROUP BY game_name
+'''
+
+# Query to get playtime data for free games
+FREE_GAMES_QUERY = '''
+SELECT game_name, AVG(playtime) AS average_playtime
+FROM buying_habits
+WHERE price_usd = 0
+GROUP BY game_name
+ORDER BY average_playtime DESC
+LIMIT 20
+'''
@@ -0,0 +1,199 @@
+""" Read-only local HTTP service that serves the analyze aggregates as JSON.
+
+Queries run on a pool of read-only SQLite connections. Results are cached in memory and the
+cache is cleared whenever PRAGMA data_version shows that another connection has written to
+the database, so dashboards can poll without repeating full-table scans.
+
+    python serve.py --habits-db buy_habits.db --port 8000
+    curl http://127.0.0.1:8000/top-games
+"""
+import argparse
+import contextlib
+import json
+import queue
+import sqlite3
+import threading
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+import queries
+
+# URL path -> query in queries.py
+ENDPOINTS = {
+    '/top-games': queries.MOST_OWNED_QUERY,
+    '/genre-distribution': queries.GENRE_QUERY,
+    '/price-by-genre': queries.AVG_PRICE_BY_GENRE_QUERY,
+    '/playtime-by-genre': queries.AVG_PLAYTIME_BY_GENRE_QUERY,
+    '/average-playtime': queries.PLAYTIME_QUERY,
+    '/top-developers': queries.TOP_DEVELOPERS_QUERY,
+    '/top-publishers': queries.TOP_PUBLISHERS_QUERY,
+    '/discounts': queries.DISCOUNT_ANALYSIS_QUERY,
+    '/spending-by-game': queries.TOTAL_SPENDING_QUERY,
+    '/average-price-by-game': queries.AVERAGE_PRICE_QUERY,
+    '/currency-distribution': queries.CURRENCY_QUERY,
+    '/free-games': queries.FREE_GAMES_QUERY,
+}
+
+def connect_read_only(db_name):
+    """ Open a read-only connection that can be handed between server threads. """
+    conn = sqlite3.connect(f'file:{db_name}?mode=ro', uri=True, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+class ConnectionPool:
+    """ A fixed set of read-only connections shared by the request threads. """
+
+    def __init__(self, db_name, size=4):
+        self._connections = queue.Queue()
+        for _ in range(size):
+            self._connections.put(connect_read_only(db_name))
+
+    @contextlib.contextmanager
+    def connection(self):
+        """ Borrow a connection, waiting if they are all in use. """
+        conn = self._connections.get()
+        try:
+            yield conn
+        finally:
+            self._connections.put(conn)
+
+    def close(self):
+        """ Close every connection that is back in the pool. """
+        while not self._connections.empty():
+            self._connections.get().close()
+
+class ResultCache:
+    """ Encoded query results, dropped whenever the database changes. """
+
+    def __init__(self, db_name):
+        # data_version only changes for commits made by other connections, so watch from a
+        # connection of our own that never writes
+        self._watch_conn = connect_read_only(db_name)
+        self._lock = threading.Lock()
+        self._data_version = None
+        self._results = {}
+        # Keys being computed right now, so concurrent misses share one query
+        self._pending = {}
+
+    def _check_version(self):
+        data_version = self._watch_conn.execute('PRAGMA data_version').fetchone()[0]
+        if data_version != self._data_version:
+            self._data_version = data_version
+            self._results.clear()
+            # Requests from now on must not wait on a query that may have read the old data
+            self._pending.clear()
+
+    def get(self, key, compute):
+        """ Return the cached result for key, calling compute() to fill it on a miss.
+
+        Only one thread computes a missing key; any others asking for it meanwhile wait for
+        that result instead of running the same query.
+        """
+        with self._lock:
+            self._check_version()
+            if key in self._results:
+                return self._results[key]
+            pending = self._pending.get(key)
+            if pending is not None:
+                owner = False
+            else:
+                owner = True
+                pending = self._pending[key] = Future()
+                data_version = self._data_version
+        if not owner:
+            return pending.result()
+
+        try:
+            result = compute()
+        except BaseException as e:
+            pending.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                if self._pending.get(key) is pending:
+                    del self._pending[key]
+                # Don't store a result computed against data that changed in the meantime
+                if not pending.done() and data_version == self._data_version:
+                    self._results[key] = result
+        pending.set_result(result)
+        return result
+
+    def close(self):
+        self._watch_conn.close()
+
+class AnalyticsService:
+    """ Runs the endpoint queries through the pool and cache. """
+
+    def __init__(self, db_name, pool_size=4):
+        self.pool = ConnectionPool(db_name, pool_size)
+        self.cache = ResultCache(db_name)
+
+    def fetch(self, path):
+        """ Return the JSON body for an endpoint. """
+        query = ENDPOINTS[path]
+
+        def compute():
+            with self.pool.connection() as conn:
+                rows = conn.execute(query).fetchall()
+            return json.dumps([dict(row) for row in rows]).encode()
+
+        return self.cache.get(path, compute)
+
+    def close(self):
+        self.pool.close()
+        self.cache.close()
+
+class RequestHandler(BaseHTTPRequestHandler):
+    """ Serves GET requests for the endpoints in ENDPOINTS. """
+
+    service = None
+
+    def do_GET(self):
+        path = urlsplit(self.path).path.rstrip('/') or '/'
+        if path == '/':
+            self.send_json(200, json.dumps(sorted(ENDPOINTS)).encode())
+        elif path in ENDPOINTS:
+            try:
+                self.send_json(200, self.service.fetch(path))
+            except sqlite3.Error as e:
+                self.send_json(500, json.dumps({'error': str(e)}).encode())
+        else:
+            self.send_json(404, json.dumps({'error': f'Unknown endpoint {path}'}).encode())
+
+    def send_json(self, status, body):
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Polling dashboards would flood the console otherwise
+        pass
+
+def serve(db_name='buy_habits.db', host='127.0.0.1', port=8000, pool_size=4):
+    """ Serve the analytics endpoints until interrupted. """
+    service = AnalyticsService(db_name, pool_size)
+    handler = type('BoundRequestHandler', (RequestHandler,), {'service': service})
+    server = ThreadingHTTPServer((host, port), handler)
+    print(f"Serving {db_name} on http://{host}:{server.server_port}/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve the Steam analytics aggregates as JSON.')
+    parser.add_argument('--habits-db', default='buy_habits.db', help='buy_habits database path')
+    parser.add_argument('--host', default='127.0.0.1', help='address to listen on')
+    parser.add_argument('--port', type=int, default=8000, help='port to listen on')
+    parser.add_argument('--pool-size', type=int, default=4, help='number of read-only SQLite connections')
+    args = parser.parse_args()
+    serve(args.habits_db, args.host, args.port, args.pool_size)
+
+if __name__ == "__main__":
+    main()
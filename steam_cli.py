@@ -0,0 +1,199 @@
+""" Non-interactive entry point for the gatherer, miner, analyze scripts and query service.
+
+Settings come from command-line flags, then STEAM_* environment variables, then the [steam]
+section of an INI config file. Heavy libraries (requests, pandas, matplotlib, seaborn) are only
+imported inside the subcommand that needs them, so scheduled runs start quickly.
+
+    python steam_cli.py gather --start-id 76561198000000000
+    STEAM_API_KEY=... python steam_cli.py mine
+    python steam_cli.py --config steam.ini analyze 1 3
+    python steam_cli.py chart currency_distribution
+    python steam_cli.py serve --port 8000
+"""
+import argparse
+import configparser
+import importlib
+import os
+import sys
+
+DEFAULT_CONFIG = 'steam.ini'
+
+ANALYZE_SCRIPTS = ['1', '2', '3', '4']
+
+# Chart name -> (analyze module, query in queries.py, plot function, optional data preparation function)
+CHARTS = {
+    'genre_distribution': ('analyze1', 'GENRE_QUERY', 'plot_genre_distribution', None),
+    'average_playtime': ('analyze1', 'PLAYTIME_QUERY', 'plot_average_playtime', None),
+    'most_owned_games': ('analyze1', 'MOST_OWNED_QUERY', 'plot_most_owned_games', None),
+    'avg_price_by_genre': ('analyze1', 'AVG_PRICE_BY_GENRE_QUERY', 'plot_average_price_by_genre', None),
+    'top_developers': ('analyze1', 'TOP_DEVELOPERS_QUERY', 'plot_top_developers', None),
+    'top_publishers': ('analyze1', 'TOP_PUBLISHERS_QUERY', 'plot_top_publishers', None),
+    'discount_analysis': ('analyze1', 'DISCOUNT_ANALYSIS_QUERY', 'discount_analysis', None),
+    'price_distribution': ('analyze1', 'PRICE_QUERY', 'plot_price_distribution', None),
+    'playtime_vs_price': ('analyze1', 'PLAYTIME_PRICE_CORRELATION_QUERY', 'plot_playtime_vs_price', None),
+    'spending_by_game': ('analyze2', 'TOTAL_SPENDING_QUERY', 'plot_spending_by_game', None),
+    'average_price_by_game': ('analyze2', 'AVERAGE_PRICE_QUERY', 'plot_average_price_by_game', None),
+    'currency_distribution': ('analyze3', 'CURRENCY_QUERY', 'plot_currency_distribution', None),
+    'playtime_vs_price_scatter': ('analyze4', 'PLAYTIME_PRICE_QUERY', 'plot_playtime_vs_price_scatter',
+                                  'prepare_playtime_price_data'),
+    'playtime_for_free_games': ('analyze4', 'FREE_GAMES_QUERY', 'plot_playtime_for_free_games', None),
+    'playtime_by_price_category': ('analyze4', 'PLAYTIME_PRICE_QUERY', 'plot_playtime_by_price_category',
+                                   'prepare_playtime_price_data'),
+}
+
+def load_config(path):
+    """ Read the [steam] section of an INI file, or return an empty dict if there is none. """
+    if path is None:
+        path = os.environ.get('STEAM_CONFIG')
+        if path is None and os.path.exists(DEFAULT_CONFIG):
+            path = DEFAULT_CONFIG
+    if path is None:
+        return {}
+    parser = configparser.ConfigParser()
+    if not parser.read(path):
+        raise SystemExit(f"Config file not found: {path}")
+    return dict(parser['steam']) if parser.has_section('steam') else {}
+
+def setting(args, name, default=None, required=False):
+    """ Resolve a setting from the command line, then STEAM_<NAME>, then the config file. """
+    value = getattr(args, name, None)
+    if value is None:
+        value = os.environ.get('STEAM_' + name.upper())
+    if value is None:
+        value = args.config_values.get(name)
+    if value is None:
+        value = default
+    if value is None and required:
+        args.parser.error(f"missing {name}: pass --{name.replace('_', '-')}, "
+                          f"set STEAM_{name.upper()} or add '{name}' to the [steam] config section")
+    return value
+
+def use_output_dir(args):
+    """ Switch to the output directory, since the plot functions save to the working directory. """
+    out_dir = setting(args, 'out_dir')
+    if out_dir:
+        os.makedirs(out_dir, exist_ok=True)
+        os.chdir(out_dir)
+
+def use_plot_backend(args):
+    """ Render off-screen unless --show was passed, so plt.show() does not block unattended runs. """
+    if not args.show:
+        import matplotlib
+        matplotlib.use('Agg')
+
+def cmd_gather(args):
+    """ Collect Steam IDs by walking the friends graph. """
+    api_key = setting(args, 'api_key', required=True)
+    start_id = setting(args, 'start_id', required=True)
+    max_users = setting(args, 'max_users')
+    users_db = setting(args, 'users_db', 'steam_users.db')
+
+    import UserGatherer
+    UserGatherer.gather_users(api_key, start_id, int(max_users or UserGatherer.MAX_USERS), users_db)
+
+def cmd_mine(args):
+    """ Fetch buying habits for one Steam ID or every collected ID. """
+    api_key = setting(args, 'api_key', required=True)
+    steam_id = setting(args, 'steam_id')
+    users_db = setting(args, 'users_db', 'steam_users.db')
+    habits_db = setting(args, 'habits_db', 'buy_habits.db')
+
+    import secure_steam_mine
+    secure_steam_mine.mine_buying_habits(api_key, steam_id, users_db, habits_db)
+
+def cmd_analyze(args):
+    """ Run whole analyze scripts. """
+    scripts = args.scripts or ANALYZE_SCRIPTS
+    for script in scripts:
+        if script not in ANALYZE_SCRIPTS:
+            args.parser.error(f"unknown analyze script {script!r} (choose from {', '.join(ANALYZE_SCRIPTS)})")
+    db_name = os.path.abspath(setting(args, 'habits_db', 'buy_habits.db'))
+    use_plot_backend(args)
+    # Import before changing directory, in case sys.path holds a relative entry
+    modules = [importlib.import_module(f'analyze{script}') for script in scripts]
+    use_output_dir(args)
+    for module in modules:
+        module.main(db_name)
+
+def cmd_chart(args):
+    """ Run single charts, importing only the analyze modules they live in. """
+    import sqlite3
+    db_name = os.path.abspath(setting(args, 'habits_db', 'buy_habits.db'))
+    use_plot_backend(args)
+
+    # Import before changing directory, in case sys.path holds a relative entry
+    import pandas as pd
+    import queries
+    modules = {CHARTS[chart][0]: importlib.import_module(CHARTS[chart][0]) for chart in args.charts}
+    use_output_dir(args)
+
+    conn = sqlite3.connect(db_name)
+    for chart in args.charts:
+        module_name, query_name, plot_name, prepare_name = CHARTS[chart]
+        module = modules[module_name]
+        data = pd.read_sql(getattr(queries, query_name), conn)
+        if prepare_name:
+            data = getattr(module, prepare_name)(data)
+        getattr(module, plot_name)(data)
+    conn.close()
+
+def cmd_serve(args):
+    """ Serve the analyze aggregates as JSON over HTTP. """
+    db_name = setting(args, 'habits_db', 'buy_habits.db')
+    host = setting(args, 'host', '127.0.0.1')
+    port = int(setting(args, 'port', 8000))
+    pool_size = int(setting(args, 'pool_size', 4))
+
+    import serve
+    serve.serve(db_name, host, port, pool_size)
+
+def build_parser():
+    """ Build the argument parser with one subcommand per job. """
+    parser = argparse.ArgumentParser(description='Run the Steam data collection and analysis jobs unattended.')
+    parser.add_argument('--config', help=f'INI file with a [steam] section (default: $STEAM_CONFIG or ./{DEFAULT_CONFIG})')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    gather = subparsers.add_parser('gather', help='collect Steam IDs (UserGatherer.py)')
+    gather.add_argument('--api-key', dest='api_key', help='Steam Web API key')
+    gather.add_argument('--start-id', dest='start_id', help='Steam ID to start the friends walk from')
+    gather.add_argument('--max-users', dest='max_users', type=int, help='number of Steam IDs to collect')
+    gather.add_argument('--users-db', dest='users_db', help='steam_users database path')
+    gather.set_defaults(func=cmd_gather)
+
+    mine = subparsers.add_parser('mine', help='fetch buying habits (secure_steam_mine.py)')
+    mine.add_argument('--api-key', dest='api_key', help='Steam Web API key')
+    mine.add_argument('--steam-id', dest='steam_id', help='only process this Steam ID instead of every collected one')
+    mine.add_argument('--users-db', dest='users_db', help='steam_users database path')
+    mine.add_argument('--habits-db', dest='habits_db', help='buy_habits database path')
+    mine.set_defaults(func=cmd_mine)
+
+    analyze = subparsers.add_parser('analyze', help='run analyze scripts')
+    analyze.add_argument('scripts', nargs='*', metavar='{1,2,3,4}',
+                         help='which analyze scripts to run (default: all)')
+    chart = subparsers.add_parser('chart', help='draw individual charts')
+    chart.add_argument('charts', nargs='+', choices=sorted(CHARTS), metavar='chart',
+                       help='one or more of: ' + ', '.join(sorted(CHARTS)))
+    for sub in (analyze, chart):
+        sub.add_argument('--habits-db', dest='habits_db', help='buy_habits database path')
+        sub.add_argument('--out-dir', dest='out_dir', help='directory to save the PNGs to (default: current directory)')
+        sub.add_argument('--show', action='store_true', help='open the plot windows instead of only saving them')
+    analyze.set_defaults(func=cmd_analyze)
+    chart.set_defaults(func=cmd_chart)
+
+    serve = subparsers.add_parser('serve', help='serve the analyze aggregates as JSON (serve.py)')
+    serve.add_argument('--habits-db', dest='habits_db', help='buy_habits database path')
+    serve.add_argument('--host', help='address to listen on (default: 127.0.0.1)')
+    serve.add_argument('--port', type=int, help='port to listen on (default: 8000)')
+    serve.add_argument('--pool-size', dest='pool_size', type=int, help='number of read-only SQLite connections (default: 4)')
+    serve.set_defaults(func=cmd_serve)
+    return parser
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    args.parser = parser
+    args.config_values = load_config(args.config)
+    args.func(args)
+
+if __name__ == "__main__":
+    main(sys.argv[1:])